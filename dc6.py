@@ -1,22 +1,206 @@
+import mmap
+import os
 import struct
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from io import BytesIO
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import numpy as np  # For handling the color palette
 from PIL import Image
 
+try:
+    from numba import njit  # Optional, compiles the scanline decoder to native code
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Fallback used when numba is not installed. The decorated function is
+        returned unchanged and runs as regular Python.
+        """
+        def decorator(func):
+            return func
+        return decorator
+
 # Constants
 END_OF_SCANLINE = 0x80
 MAX_RUN_LENGTH = 0x7F
 TERMINATOR_SIZE = 3
 
-# Scanline states
-class ScanlineState:
+# Decoding frames on a thread pool only pays for itself once there are enough pixels to
+# outweigh starting the threads; smaller animations are decoded in the calling thread
+PARALLEL_DECODE_MIN_PIXELS = 1 << 20
+
+# Precompiled structs for the fixed-size parts of the DC6 format
+_FILE_HDR = struct.Struct('<iII')  # Version, Flags, Encoding (followed by 4 Termination bytes)
+_COUNT_PAIR = struct.Struct('<II')  # Number of directions, frames per direction
+_FRAME_HDR = struct.Struct('<IIIiiIII')  # Flipped, Width, Height, OffsetX, OffsetY, Unknown, NextBlock, Length
+
+# Scanline states. This is an IntEnum so that numba can use its members as constants.
+class ScanlineState(IntEnum):
     END_OF_LINE = 0
     RUN_OF_TRANSPARENT_PIXELS = 1
     RUN_OF_OPAQUE_PIXELS = 2
 
+# Lookup table mapping every possible header byte to its scanline type.
+# The three types of scanlines are as follows:
+#
+# 1. End of Line: A single byte with the value of END_OF_SCANLINE
+# 2. Run of Transparent Pixels: A byte with the high bit set and a value between 0 and MAX_RUN_LENGTH
+# 3. Run of Opaque Pixels: A byte with a value between 0 and MAX_RUN_LENGTH
+#
+# The table is a bytes object rather than a numpy array: indexing it returns a plain int
+# in Python, and numba treats it as a constant.
+_SCANLINE_TYPE = bytes(
+    ScanlineState.END_OF_LINE if b == END_OF_SCANLINE
+    else ScanlineState.RUN_OF_TRANSPARENT_PIXELS if b & END_OF_SCANLINE
+    else ScanlineState.RUN_OF_OPAQUE_PIXELS
+    for b in range(256)
+)
+
+
+@njit(cache=True, nogil=True)
+def _decode_scanlines(framedata: np.ndarray, width: int, height: int, scratch: np.ndarray) -> np.ndarray:
+    """
+    Decodes run-length encoded DC6 scanlines into a 2-dimensional index image.
+
+    This is the inner loop of Frame.decode_frame. When numba is installed it is
+    compiled to native code (and cached on disk) that runs without holding the
+    GIL, otherwise it runs as Python.
+
+    The image is decoded into the start of the given scratch buffer, which lets
+    a single buffer be reused for every frame of an animation. The returned
+    image is a view of the scratch buffer and is overwritten by the next call.
+
+    The frame data comes from the file and is not trusted: pixels that would
+    land outside the frame are dropped instead of being written.
+
+    :param framedata: The encoded frame data as a 1-dimensional uint8 array
+    :type framedata: np.ndarray
+    :param width: The width of the frame in pixels
+    :type width: int
+    :param height: The height of the frame in pixels
+    :type height: int
+    :param scratch: A 1-dimensional uint8 buffer of at least width * height bytes
+    :type scratch: np.ndarray
+    :return: A uint8 array of shape (height, width) holding palette indices
+    :rtype: np.ndarray
+    """
+    # Clear the used part of the scratch buffer and view it as a 2-dimensional image
+    image = scratch[:width * height].reshape((height, width))
+    image[:] = 0
+    length = framedata.shape[0]
+
+    # An empty frame has no pixels to decode
+    if width == 0 or height == 0:
+        return image
+
+    # Bind the scanline types to local ints, which are much cheaper to compare against
+    # in Python than the IntEnum members
+    end_of_line = ScanlineState.END_OF_LINE.value
+    run_of_transparent_pixels = ScanlineState.RUN_OF_TRANSPARENT_PIXELS.value
+
+    # Initialize the x and y coordinates to the top-left of the frame
+    x = 0
+    y = height - 1
+
+    # Initialize the offset to the first byte of the FrameData
+    offset = 0
+
+    # Loop over the scanline header bytes. Opaque runs are copied with a single
+    # slice assignment rather than one pixel at a time.
+    while offset < length:
+
+        # Get the next header byte from the FrameData and look up its scanline type
+        b = int(framedata[offset])
+        offset += 1
+        scanline_type = _SCANLINE_TYPE[b]
+
+        # End of Line: move to the next line, or stop once past the top of the frame
+        if scanline_type == end_of_line:
+            if y < 0:
+                break
+            y -= 1
+            x = 0
+
+        # Run of Transparent Pixels: advance the x coordinate
+        elif scanline_type == run_of_transparent_pixels:
+            x += b & MAX_RUN_LENGTH
+
+        # Run of Opaque Pixels: copy the run of color indices into the current row,
+        # clamped to the remaining FrameData to prevent reading beyond it and to the
+        # frame to prevent writing outside it
+        else:
+            run = min(b, length - offset)
+            if 0 <= y < height and x < width:
+                visible = min(run, width - x)
+                image[y, x:x + visible] = framedata[offset:offset + visible]
+            offset += run
+            x += run
+
+    return image
+
+
+def _encode_png(job: Tuple[np.ndarray, np.ndarray, str]) -> None:
+    """
+    Converts a frame's index data to RGBA and encodes it as a PNG file.
+
+    This is used by DC6File.save_frames, either directly or from its worker
+    threads. The RGBA array is only built here, so at most one per worker
+    exists at a time.
+
+    The image is created with Image.frombuffer, which wraps the array's memory
+    instead of copying it, so the array must stay alive until it is saved.
+
+    :param job: A tuple of the (height, width) uint8 index array, the (256, 4) uint8 palette
+        and the path to save the image to
+    :type job: Tuple[np.ndarray, np.ndarray, str]
+    :return: None
+    """
+    indices, palette, path = job
+
+    # Look up the RGBA color of every pixel in the palette at once
+    rgba = np.ascontiguousarray(palette[indices], dtype=np.uint8)
+    height, width = rgba.shape[:2]
+    image = Image.frombuffer("RGBA", (width, height), rgba, "raw", "RGBA", 0, 1)
+    image.save(path)
+
+
 class Frame:
     def __init__(self):
+        """
+        Initializes a new instance of the Frame class.
+
+        The Frame class represents a single frame of a direction in a DC6 animation. It
+        holds the frame header, the encoded frame data and, once decode_frame has been
+        called, the decoded palette indices.
+
+        :ivar Flipped: Whether the frame is stored top-down instead of bottom-up
+        :type Flipped: int
+        :ivar Width: The width of the frame in pixels
+        :type Width: int
+        :ivar Height: The height of the frame in pixels
+        :type Height: int
+        :ivar OffsetX: The horizontal offset of the frame
+        :type OffsetX: int
+        :ivar OffsetY: The vertical offset of the frame
+        :type OffsetY: int
+        :ivar Unknown: An unused header field
+        :type Unknown: int
+        :ivar NextBlock: The file offset of the next frame
+        :type NextBlock: int
+        :ivar Length: The length of the encoded frame data in bytes
+        :type Length: int
+        :ivar FrameData: The run-length encoded frame data
+        :type FrameData: bytes
+        :ivar Terminator: The terminator bytes following the frame data
+        :type Terminator: bytes
+        :ivar index_array: The palette index of every pixel, as a uint8 array of shape
+            (Height, Width), or None if the frame hasn't been decoded. IndexData returns
+            the same data as bytes.
+        :type index_array: Optional[np.ndarray]
+        """
         self.Flipped: int = 0
         self.Width: int = 0
         self.Height: int = 0
@@ -27,17 +211,59 @@ class Frame:
         self.Length: int = 0
         self.FrameData: bytes = b''
         self.Terminator: bytes = b''
-        self.IndexData: Optional[bytes] = None
+        self.index_array: Optional[np.ndarray] = None
+
+    @property
+    def IndexData(self) -> Optional[bytes]:
+        """
+        Returns the decoded index data of the frame as bytes.
+
+        The decoded frame is stored in index_array, a uint8 numpy array of
+        shape (Height, Width). This property converts it to bytes on every
+        access, so code that reads the pixels should use index_array instead.
+
+        :return: The palette index of every pixel, row by row, or None if the frame hasn't been decoded
+        :rtype: Optional[bytes]
+        """
+        if self.index_array is None:
+            return None
+        return self.index_array.tobytes()
+
+    @IndexData.setter
+    def IndexData(self, index_data: Optional[bytes]):
+        """
+        Sets the decoded index data of the frame.
+
+        The bytes are copied into index_array as an array of shape (Height, Width),
+        so the frame's Width and Height must already be set.
 
-    def decode_frame(self) -> None:
+        :param index_data: The palette index of every pixel, row by row, or None
+        :type index_data: Optional[bytes]
+        :return: None
+        :raises ValueError: If the length of the index data isn't Width * Height
+        """
+        if index_data is None:
+            self.index_array = None
+            return
+
+        indices = np.frombuffer(index_data, dtype=np.uint8)
+        if len(indices) != self.Width * self.Height:
+            raise ValueError(
+                f"Index data must be {self.Width * self.Height} bytes for a "
+                f"{self.Width}x{self.Height} frame, got {len(indices)}"
+            )
+        self.index_array = indices.reshape(self.Height, self.Width).copy()
+
+    def decode_frame(self, scratch: Optional[np.ndarray] = None) -> None:
         """
         Decodes the frame data from the DC6 format into an index data array.
 
         The DC6 format stores frame data in a compressed format, which is
         decoded into an index data array by this method.
 
-        The index data array is a 1-dimensional array of bytes, where each
-        byte represents the index of a color in the color palette.
+        The index data array is stored in index_array, a uint8 numpy array of
+        shape (Height, Width), where each value represents the index of a
+        color in the color palette.
 
         This method decodes the frame data by iterating over the FrameData
         bytes and determining the type of scanline represented by each byte.
@@ -45,102 +271,48 @@ class Frame:
         Pixels, and Run of Opaque Pixels.
 
         For each scanline, the relevant information is extracted from the
-        FrameData and used to populate the index data array.
-
+        FrameData and used to populate the index data array. The work itself
+        is done by _decode_scanlines, which is compiled with numba when it is
+        available.
+
+        :param scratch: An optional uint8 buffer of at least Width * Height bytes to
+            decode into. Passing the same buffer for many frames avoids allocating a
+            new one for each frame.
+        :type scratch: Optional[np.ndarray]
         :return: None
         """
 
-        # Initialize an empty index data array with the correct size
-        index_data = bytearray(self.Width * self.Height)
+        # Allocate a buffer to decode into if a large enough one wasn't given
+        num_pixels = self.Width * self.Height
+        shared = scratch is not None and len(scratch) >= num_pixels
+        if not shared:
+            scratch = np.empty(num_pixels, dtype=np.uint8)
 
-        # Initialize the x and y coordinates to the top-left of the frame
-        x = 0
-        y = self.Height - 1
+        # View the FrameData as an array of unsigned bytes without copying it and
+        # decode the scanlines into a 2-dimensional index image
+        framedata = np.frombuffer(self.FrameData, dtype=np.uint8)
+        image = _decode_scanlines(framedata, self.Width, self.Height, scratch)
 
-        # Initialize the offset to the first byte of the FrameData
-        offset = 0
-
-        # Loop until we've processed all the FrameData bytes
-        while True:
-            
-            # If we've reached the end of the FrameData, break out of the loop
-            if offset >= len(self.FrameData):
-                break
-
-            # Get the next byte from the FrameData
-            b = self.FrameData[offset]
-            offset += 1
-
-            # Determine the type of scanline represented by this byte
-            scanline_type = self.get_scanline_type(b)
-
-            # If this is an End of Line scanline, move to the next line
-            if scanline_type == ScanlineState.END_OF_LINE:
-                
-                # If we've reached the top of the frame, break out of the loop
-                if y < 0:
-                    break
-                
-                # Move to the next line
-                y -= 1
-                x = 0
-                
-            # If this is a Run of Transparent Pixels scanline, advance the x coordinate
-            elif scanline_type == ScanlineState.RUN_OF_TRANSPARENT_PIXELS:
-                # Get the number of transparent pixels from the byte
-                transparent_pixels = b & MAX_RUN_LENGTH
-
-                # Advance the x coordinate by the number of transparent pixels
-                x += transparent_pixels
-                
-            # If this is a Run of Opaque Pixels scanline, populate the index data array
-            elif scanline_type == ScanlineState.RUN_OF_OPAQUE_PIXELS:
-                
-                # Loop until we've processed all the pixels in the run
-                for _ in range(b):
-                    
-                    # If we've reached the end of the FrameData, break out of the loop
-                    if offset >= len(self.FrameData):
-                        break  # Prevent reading beyond FrameData
-                    
-                    # Get the index of the color from the FrameData
-                    index_data[x + y * self.Width] = self.FrameData[offset]
-                    offset += 1
-                    x += 1
-
-        # Set the IndexData property to the completed index data array
-        self.IndexData = bytes(index_data)
+        # Store the completed index data array. A shared scratch buffer is reused for
+        # the next frame, so the frame keeps its own copy; a buffer allocated above
+        # belongs to this frame and is kept as it is.
+        self.index_array = image.copy() if shared else image
 
     def get_scanline_type(self, b: int) -> int:
         """
         Determine the type of scanline given the byte value.
 
         Given a single byte from the frame data, this function returns the type of scanline
-        represented by that byte.
+        represented by that byte, as one of the ScanlineState values.
 
         :param b: The byte from the frame data to determine the scanline type from
         :return: The type of scanline represented by the given byte
         :rtype: int
         """
-        # If the byte is equal to END_OF_SCANLINE, then it's an End of Line scanline
-        if b == END_OF_SCANLINE:
-            return ScanlineState.END_OF_LINE
-
-        # If the byte has the high bit set, then it's a Run of Transparent Pixels scanline
-        # This is determined by performing a bitwise AND with the END_OF_SCANLINE constant
-        elif (b & END_OF_SCANLINE) > 0:
-            return ScanlineState.RUN_OF_TRANSPARENT_PIXELS
+        # The scanline type of every possible byte is precomputed in the _SCANLINE_TYPE
+        # lookup table
+        return _SCANLINE_TYPE[b]
 
-        # If the byte doesn't match either of the above criteria, then it's a Run of Opaque Pixels
-        # scanline
-        return ScanlineState.RUN_OF_OPAQUE_PIXELS
-
-        # The three types of scanlines are as follows:
-        #
-        # 1. End of Line: A single byte with the value of END_OF_SCANLINE
-        # 2. Run of Transparent Pixels: A byte with the high bit set and a value between 0 and MAX_RUN_LENGTH
-        # 3. Run of Opaque Pixels: A byte with a value between 0 and MAX_RUN_LENGTH
-    
     def as_dict(self) -> dict:
         """
         Returns a dictionary representation of the Frame object.
@@ -183,7 +355,7 @@ class Direction:
         :return: A dictionary containing the Direction object's properties
         :rtype: dict
         """
-        return {frame.as_dict() for frame in self.Frames}
+        return {"Frames": [frame.as_dict() for frame in self.Frames]}
 
 
 class DC6:
@@ -217,19 +389,32 @@ class DC6:
         self.palette: Optional[np.ndarray] = None
         self.Frames = []
     
+    def iter_frames(self) -> Iterator[Frame]:
+        """
+        Iterates over all frames in the animation, direction by direction.
+
+        Unlike the frames property, this yields the Frame objects themselves
+        and doesn't build a list or any dictionaries.
+
+        :return: An iterator over all frames in the animation
+        :rtype: Iterator[Frame]
+        """
+        for direction in self.Directions:
+            yield from direction.Frames
+
     @property
     def frames(self) -> List[dict]:
         """
         Returns a list of all frames in the animation.
 
-        :return: A list of all frames in the animation
-        :rtype: List[Frame]
+        Each frame is converted to a dictionary with Frame.as_dict, and the list is
+        rebuilt on every access. Use iter_frames to loop over the Frame objects
+        without that cost.
+
+        :return: A list of all frames in the animation, as dictionaries
+        :rtype: List[dict]
         """
-        frames = []
-        for direction in self.Directions:
-            for frame in direction.Frames:
-                frames.append(frame.as_dict())
-        return frames
+        return [frame.as_dict() for frame in self.iter_frames()]
     
     @frames.setter
     def frames(self, new_frames: List[Frame]):
@@ -271,7 +456,8 @@ class DC6:
         DC6 object from it. The new object will have its properties populated from the
         given data.
 
-        :param data: The DC6 data to create the object from
+        :param data: The DC6 data to create the object from. Any object supporting the
+            buffer protocol, such as bytes, bytearray or mmap, can be used.
         :type data: bytes
         :return: The new DC6 object
         :rtype: DC6
@@ -312,25 +498,18 @@ class DC6:
         :return: None
         """
 
-        # Read the version of the DC6 animation from the stream. The version is a 4-byte
-        # integer, so we use the '<I' format specifier to unpack it.
-        version_bytes = 4
-        self.Version, = struct.unpack('<i', stream.read(version_bytes))
+        # Read the whole 16-byte header from the stream in one go
+        header_bytes = 16
+        header = stream.read(header_bytes)
 
-        # Read the flags of the DC6 animation from the stream. The flags are a 4-byte
-        # integer, so we use the '<I' format specifier to unpack it.
-        flags_bytes = 4
-        self.Flags, = struct.unpack('<I', stream.read(flags_bytes))
+        # Unpack the version, flags and encoding of the DC6 animation from the header with
+        # a single call. The version is a signed 4-byte integer ('<i'), and the flags and
+        # encoding are unsigned 4-byte integers ('<I').
+        self.Version, self.Flags, self.Encoding = _FILE_HDR.unpack_from(header)
 
-        # Read the encoding of the DC6 animation from the stream. The encoding is a 4-byte
-        # integer, so we use the '<I' format specifier to unpack it.
-        encoding_bytes = 4
-        self.Encoding, = struct.unpack('<I', stream.read(encoding_bytes))
-
-        # Read the termination bytes of the DC6 animation from the stream. The termination
-        # bytes are always 0, so we don't need to unpack them.
-        termination_bytes = 4
-        self.Termination = stream.read(termination_bytes)
+        # The termination bytes are the last 4 bytes of the header. They are always 0,
+        # so we don't need to unpack them.
+        self.Termination = header[12:16].tobytes()
 
     def decode_body(self, stream: 'MemoryStream'):
         """
@@ -361,15 +540,17 @@ class DC6:
         :type stream: MemoryStream
         :return: None
         """
-        directions_bytes = 4
-        frames_per_direction_bytes = 4
         frame_pointer_bytes = 4
+        frame_header_bytes = _FRAME_HDR.size
 
-        # Read the number of directions in the animation
-        num_directions, = struct.unpack('<I', stream.read(directions_bytes))
+        # Bind the methods used for every frame to locals, to avoid looking them up
+        # again on each iteration of the frame loop
+        read = stream.read
+        unpack_frame_header = _FRAME_HDR.unpack
 
-        # Read the number of frames in each direction
-        frames_per_direction, = struct.unpack('<I', stream.read(frames_per_direction_bytes))
+        # Read the number of directions in the animation and the number of frames in
+        # each direction
+        num_directions, frames_per_direction = _COUNT_PAIR.unpack(read(_COUNT_PAIR.size))
 
         # Calculate the total number of frames in the animation
         total_frames = num_directions * frames_per_direction
@@ -377,9 +558,8 @@ class DC6:
         # Initialize the Directions list with the correct number of Direction objects
         self.Directions = [Direction() for _ in range(num_directions)]
 
-        # Discard the frame pointers for now
-        for _ in range(total_frames):
-            stream.read(frame_pointer_bytes)
+        # Discard the frame pointers for now by skipping over them
+        stream.skip(frame_pointer_bytes * total_frames)
 
         # Iterate over each frame in the animation
         for idx in range(total_frames):
@@ -390,27 +570,47 @@ class DC6:
             # Initialize a new Frame object
             frame = Frame()
 
-            # Read the frame data from the stream
-            frame.Flipped, = struct.unpack('<I', stream.read(4))
-            frame.Width, = struct.unpack('<I', stream.read(4))
-            frame.Height, = struct.unpack('<I', stream.read(4))
-            frame.OffsetX, = struct.unpack('<i', stream.read(4))
-            frame.OffsetY, = struct.unpack('<i', stream.read(4))
-            frame.Unknown, = struct.unpack('<I', stream.read(4))
-            frame.NextBlock, = struct.unpack('<I', stream.read(4))
-            frame.Length, = struct.unpack('<I', stream.read(4))
-            frame.FrameData = stream.read(frame.Length)
-            frame.Terminator = stream.read(TERMINATOR_SIZE)
+            # Read the 32-byte frame header from the stream and unpack all of its fields
+            # with a single call
+            (
+                frame.Flipped,
+                frame.Width,
+                frame.Height,
+                frame.OffsetX,
+                frame.OffsetY,
+                frame.Unknown,
+                frame.NextBlock,
+                frame.Length,
+            ) = unpack_frame_header(read(frame_header_bytes))
+
+            # Read the frame data and terminator from the stream. These are kept on the
+            # frame, so they are copied out of the stream as bytes.
+            frame.FrameData = read(frame.Length).tobytes()
+            frame.Terminator = read(TERMINATOR_SIZE).tobytes()
 
             # Add the new frame to the correct direction
             self.Directions[dir_idx].Frames.append(frame)
 
-        # Iterate over each direction in the animation
-        for direction in self.Directions:
-            # Iterate over each frame in the direction
-            for frame in direction.Frames:
-                # Decode the frame data
+        # Gather every frame in the animation
+        frames = list(self.iter_frames())
+
+        total_pixels = sum(frame.Width * frame.Height for frame in frames)
+
+        # Without numba the decoder holds the GIL, with a single CPU there is nothing to
+        # gain from threads, and for small animations starting them costs more than it
+        # saves, so decode the frames one after the other. Each frame decodes into a
+        # buffer of its own and keeps it as its index_array, so no pixels are copied.
+        cpu_count = os.cpu_count() or 1
+        if (not NUMBA_AVAILABLE or cpu_count < 2 or len(frames) < 2
+                or total_pixels < PARALLEL_DECODE_MIN_PIXELS):
+            for frame in frames:
                 frame.decode_frame()
+            return
+
+        # The compiled decoder releases the GIL and the frames are independent, so
+        # decode them in parallel, with no more threads than there are frames
+        with ThreadPoolExecutor(max_workers=min(cpu_count, len(frames))) as executor:
+            list(executor.map(Frame.decode_frame, frames))
 
     def get_default_palette(self) -> np.ndarray:
         """
@@ -427,19 +627,15 @@ class DC6:
         :return: A numpy array of 256 colors, each represented by 4 bytes (RGB + Alpha)
         :rtype: np.ndarray
         """
-        # Initialize the palette array with zeros
+        # Initialize the palette array
         num_colors = 256
-        palette = np.zeros((num_colors, 4), dtype=np.uint8)
+        palette = np.empty((num_colors, 4), dtype=np.uint8)
 
-        # Iterate over each color in the palette
-        for idx in range(num_colors):
-            # Set the RGB values of this color to the current index
-            palette[idx, 0] = idx
-            palette[idx, 1] = idx
-            palette[idx, 2] = idx
+        # Set the RGB values of every color to its index
+        palette[:, :3] = np.arange(num_colors, dtype=np.uint8)[:, None]
 
-            # Set the Alpha value of this color to 255 (fully opaque)
-            palette[idx, 3] = 255
+        # Set the Alpha value of every color to 255 (fully opaque)
+        palette[:, 3] = 255
 
         # Return the completed palette
         return palette
@@ -484,6 +680,29 @@ class DC6:
             "Frames": self.frames,
         }
     
+    def get_frames_per_direction(self) -> int:
+        """
+        Returns the number of frames in each direction of the animation.
+
+        The DC6 format stores a single frame count for all directions, so every
+        direction must contain the same number of frames to be serialized.
+
+        :return: The number of frames in each direction, or 0 if there are no directions
+        :rtype: int
+        :raises ValueError: If the directions don't all have the same number of frames
+        """
+        if not self.Directions:
+            return 0
+
+        frames_per_direction = len(self.Directions[0].Frames)
+        for direction in self.Directions:
+            if len(direction.Frames) != frames_per_direction:
+                raise ValueError(
+                    "All directions must have the same number of frames: "
+                    f"{[len(direction.Frames) for direction in self.Directions]}"
+                )
+        return frames_per_direction
+
     def dump(self) -> bytes:
         """
         Serializes the DC6 object into a bytes representation according to the DC6 format.
@@ -491,43 +710,60 @@ class DC6:
         :return: A bytes object containing the serialized DC6 data
         :rtype: bytes
         """
-        # Create a MemoryStream to store the output data
-        output_stream = bytearray()
+        # Work out the number of directions and frames per direction
+        num_directions = len(self.Directions)
+        frames_per_direction = self.get_frames_per_direction()
+        frames = list(self.iter_frames())
 
-        # Write the header
-        output_stream.extend(struct.pack('<I', self.Version))
-        output_stream.extend(struct.pack('<I', self.Flags))
-        output_stream.extend(struct.pack('<I', self.Encoding))
-        output_stream.extend(b'\x00\x00\x00\x00')  # Termination (4 bytes, always 0)
+        # Calculate the total size of the output so it can be allocated in one go. The
+        # buffer starts out zeroed, so the termination, the frame pointers and the frame
+        # terminators don't need to be written.
+        termination_bytes = 4
+        frame_pointer_bytes = 4
+        total_size = (
+            _FILE_HDR.size
+            + termination_bytes
+            + _COUNT_PAIR.size
+            + frame_pointer_bytes * num_directions * frames_per_direction
+            + sum(_FRAME_HDR.size + len(frame.FrameData) + TERMINATOR_SIZE for frame in frames)
+        )
+        output_stream = bytearray(total_size)
+
+        # Write the header, followed by the termination (4 bytes, always 0)
+        _FILE_HDR.pack_into(output_stream, 0, self.Version, self.Flags, self.Encoding)
+        offset = _FILE_HDR.size + termination_bytes
 
         # Write the number of directions and frames per direction
-        num_directions = len(self.Directions)
-        frames_per_direction = len(self.Directions[0].Frames) if num_directions > 0 else 0
-        output_stream.extend(struct.pack('<I', num_directions))
-        output_stream.extend(struct.pack('<I', frames_per_direction))
+        _COUNT_PAIR.pack_into(output_stream, offset, num_directions, frames_per_direction)
+        offset += _COUNT_PAIR.size
 
-        # Write frame pointers (ignored, but must be present)
-        for _ in range(num_directions * frames_per_direction):
-            output_stream.extend(struct.pack('<I', 0))  # Placeholder pointers
+        # Skip the frame pointers (ignored, but must be present)
+        offset += frame_pointer_bytes * num_directions * frames_per_direction
 
         # Write the frame data for each direction and frame
-        for direction in self.Directions:
-            for frame in direction.Frames:
-                # Write the frame properties
-                output_stream.extend(struct.pack('<I', frame.Flipped))
-                output_stream.extend(struct.pack('<I', frame.Width))
-                output_stream.extend(struct.pack('<I', frame.Height))
-                output_stream.extend(struct.pack('<i', frame.OffsetX))
-                output_stream.extend(struct.pack('<i', frame.OffsetY))
-                output_stream.extend(struct.pack('<I', frame.Unknown))
-                output_stream.extend(struct.pack('<I', frame.NextBlock))
-                output_stream.extend(struct.pack('<I', frame.Length))
-                
-                # Write the frame data
-                output_stream.extend(frame.FrameData)
-                
-                # Write the terminator
-                output_stream.extend(b'\x00\x00\x00')  # Terminator (3 bytes, always 0)
+        for frame in frames:
+            # Write the frame properties
+            _FRAME_HDR.pack_into(
+                output_stream,
+                offset,
+                frame.Flipped,
+                frame.Width,
+                frame.Height,
+                frame.OffsetX,
+                frame.OffsetY,
+                frame.Unknown,
+                frame.NextBlock,
+                frame.Length,
+            )
+            offset += _FRAME_HDR.size
+
+            # Write the frame data
+            frame_data_size = len(frame.FrameData)
+            output_stream[offset:offset + frame_data_size] = frame.FrameData
+            offset += frame_data_size
+
+            # Skip the terminator (3 bytes, always 0)
+            offset += TERMINATOR_SIZE
 
         return bytes(output_stream)
     
@@ -537,16 +773,20 @@ class MemoryStream:
         """
         Initializes a new MemoryStream instance with the given data.
 
+        The data is wrapped in a read-only memoryview so that reads can
+        return slices of it without copying.
+
         :param data: The data to store in the memory stream
         :type data: bytes
         """
         self.data = data
+        self.view = memoryview(data).toreadonly()
         self.position = 0
 
-    def read(self, size: int) -> bytes:
+    def read(self, size: int) -> memoryview:
         """
         Reads the specified number of bytes from the memory stream 
-        and returns them as a byte string.
+        and returns them as a zero-copy memoryview.
 
         The current position of the memory stream is advanced by 
         the number of bytes read.
@@ -558,22 +798,23 @@ class MemoryStream:
            number of bytes to read.
 
         2. Returning the bytes between the start and end indices as
-           a byte string.
+           a memoryview slice. No bytes are copied; call tobytes() on
+           the result if it must outlive the memory stream.
 
         3. Updating the current position of the memory stream to the
            end index.
 
         :param size: The number of bytes to read
         :type size: int
-        :return: The read bytes as a byte string
-        :rtype: bytes
+        :return: The read bytes as a memoryview
+        :rtype: memoryview
         """
         # Determine the start and end indices of the bytes to read
         start = self.position
         end = start + size
 
-        # Read the bytes from the memory stream
-        data = self.data[start:end]
+        # Slice the bytes from the memory stream without copying them
+        data = self.view[start:end]
 
         # Advance the current position of the memory stream
         self.position = end
@@ -581,6 +822,54 @@ class MemoryStream:
         # Return the read bytes
         return data
 
+    def skip(self, size: int) -> None:
+        """
+        Skips the specified number of bytes in the memory stream.
+
+        The current position of the memory stream is advanced by
+        the number of bytes skipped, without reading or copying them.
+
+        :param size: The number of bytes to skip
+        :type size: int
+        :return: None
+        """
+        self.position += size
+
+
+def _read_mapped_file(file_path: str) -> DC6:
+    """
+    Reads a DC6 file by memory-mapping it and returns a DC6 instance.
+
+    Everything the parsed DC6 keeps is copied out of the mapping, so it is
+    closed as soon as parsing is done. If parsing fails, the traceback can
+    still hold views of the mapping, which makes closing it raise BufferError;
+    that is ignored so the parse error reaches the caller, and the mapping is
+    closed once the traceback is released. Empty files can't be mapped and are
+    parsed as empty bytes instead.
+
+    :param file_path: The path to the DC6 file to read
+    :type file_path: str
+    :return: An instance of the DC6 class
+    :rtype: DC6
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return DC6.from_bytes(b'')
+
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            dc6 = DC6.from_bytes(data)
+        except BaseException:
+            # Let the parse error propagate, even if the traceback keeps the mapping open
+            try:
+                data.close()
+            except BufferError:
+                pass
+            raise
+
+        data.close()
+        return dc6
+
 
 class DC6File(DC6):
     def __init__(self, file_path: str):
@@ -592,26 +881,27 @@ class DC6File(DC6):
         1. Opening the file at the specified path in binary read mode ('rb') using a with statement. 
            This ensures that the file is properly closed after it is read.
 
-        2. Reading the contents of the file into a byte string using the read() method.
+        2. Memory-mapping the contents of the file with mmap, so the file is parsed in place
+           instead of being read into a byte string first.
 
-        3. Creating a new DC6File instance from the byte string using the from_bytes() class method.
+        3. Creating a new DC6 instance from the mapped file using the from_bytes() class method.
+           Everything the parsed DC6 keeps is copied out of the mapping, so it can be closed
+           as soon as parsing is done.
 
-        4. Returning the new DC6File instance.
+        4. Copying the parsed properties onto this DC6File instance.
 
         :param file_path: The path to the DC6 file to read
         :type file_path: str
         """
-        with open(file_path, 'rb') as file:
-            # Read the contents of the file into a byte string
-            data = file.read()
+        super().__init__()
 
-        # Create a new DC6File instance from the byte string
-        dc6 = DC6.from_bytes(data)
+        # Create a new DC6 instance from the memory-mapped file
+        dc6 = _read_mapped_file(file_path)
 
-        # Return the new DC6File instance
-        super().__init__(dc6)
+        # Take over the parsed properties
+        self.__dict__.update(dc6.__dict__)
     
-    def save_frames(self, output_dir: str):
+    def save_frames(self, output_dir: str, max_workers: Optional[int] = None):
         """
         Saves all frames in the DC6 animation to separate PNG files in the specified output directory.
 
@@ -622,49 +912,52 @@ class DC6File(DC6):
 
         1. Iterate over all directions in the animation.
         2. Iterate over all frames in the current direction.
-        3. Convert the index data of the current frame to an image.
-        4. Save the image to a file in the output directory.
+        3. Convert the index data of the current frame to an RGBA array with a single palette lookup.
+        4. Encode the array as a PNG file in the output directory.
+
+        By default the frames are saved one after the other. Passing max_workers greater than 1
+        encodes them on that many threads instead, which helps because PIL releases the GIL
+        while it compresses the PNG data.
 
         :param output_dir: The directory to save the frames to
         :type output_dir: str
+        :param max_workers: The number of threads used to encode the PNG files. Defaults to
+            encoding them in the calling thread.
+        :type max_workers: Optional[int]
         """
-        import os
-
         # Check if the output directory exists, and create it if it doesn't
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        # Initialize a counter to keep track of how many frames were saved
-        frame_count = 0
+        # Use the default palette if none has been set. The palette must be a
+        # (256, 4) uint8 array so it can be indexed with the frame's index data
+        palette = self.palette if self.palette is not None else self.get_default_palette()
+        palette = np.ascontiguousarray(palette, dtype=np.uint8)
+
+        # Collect the index data and output path of every frame to save. The index
+        # arrays are shared with the frames, so this doesn't copy any pixels.
+        jobs = []
 
         # Iterate over all directions in the animation
         for direction_idx, direction in enumerate(self.Directions):
             # Iterate over all frames in the current direction
             for frame_idx, frame in enumerate(direction.Frames):
                 # Check if the frame has index data
-                if frame.IndexData is not None:
-                    # Convert the index data of the current frame to an image
-                    image = Image.new("RGBA", (frame.Width, frame.Height))
-                    pixels = image.load()
-
-                    # Iterate over all pixels in the frame
-                    for y in range(frame.Height):
-                        for x in range(frame.Width):
-                            # Get the index of the current pixel
-                            index = frame.IndexData[x + y * frame.Width]
-
-                            # Get the color of the current pixel from the palette
-                            color = self.palette[index]
-
-                            # Set the color of the current pixel in the image
-                            pixels[x, y] = (color[0], color[1], color[2], color[3])  # RGBA
-
-                    # Save the image to a file in the output directory
+                if frame.index_array is not None:
+                    # Queue the image to be saved to a file in the output directory
                     frame_filename = f"frame_dir{direction_idx}_frame{frame_idx}.png"
-                    image.save(os.path.join(output_dir, frame_filename))
+                    jobs.append((frame.index_array, palette, os.path.join(output_dir, frame_filename)))
 
-                    # Increment the frame counter
-                    frame_count += 1
+        # Encode the files in the calling thread unless more workers were asked for
+        if max_workers is None or max_workers < 2 or len(jobs) < 2:
+            for job in jobs:
+                _encode_png(job)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_encode_png, jobs))
+
+        # Count how many frames were saved
+        frame_count = len(jobs)
 
         # Print a message to the console indicating how many frames were saved
         print(f"Saved {frame_count} frames to '{output_dir}'.")
@@ -679,39 +972,55 @@ class DC6File(DC6):
         :rtype: bytes
         """
 
-        # Start with a bytearray for efficiency
-        output = bytearray()
+        # Work out the number of directions and frames per direction
+        num_directions = len(self.Directions)
+        frames_per_direction = self.get_frames_per_direction()
+        frames = list(self.iter_frames())
+
+        # Calculate the total size of the output so it can be allocated in one go. The
+        # buffer starts out zeroed, so the frame pointers don't need to be written.
+        frame_pointer_bytes = 4
+        total_size = (
+            _FILE_HDR.size
+            + len(self.Termination)
+            + _COUNT_PAIR.size
+            + frame_pointer_bytes * num_directions * frames_per_direction
+            + sum(_FRAME_HDR.size + len(frame.FrameData) + len(frame.Terminator) for frame in frames)
+        )
+        output = bytearray(total_size)
 
         # Header
-        output.extend(struct.pack('<i', self.Version))
-        output.extend(struct.pack('<I', self.Flags))
-        output.extend(struct.pack('<I', self.Encoding))
-        output.extend(self.Termination)
+        _FILE_HDR.pack_into(output, 0, self.Version, self.Flags, self.Encoding)
+        offset = _FILE_HDR.size
+        output[offset:offset + len(self.Termination)] = self.Termination
+        offset += len(self.Termination)
 
         # Body
-        num_directions = len(self.Directions)
-        frames_per_direction = max(len(direction.Frames) for direction in self.Directions) if self.Directions else 0
-
-        output.extend(struct.pack('<I', num_directions))
-        output.extend(struct.pack('<I', frames_per_direction))
+        _COUNT_PAIR.pack_into(output, offset, num_directions, frames_per_direction)
+        offset += _COUNT_PAIR.size
 
         # Frame pointers (currently just placeholders)
-        for _ in range(num_directions * frames_per_direction):
-            output.extend(struct.pack('<I', 0))  # Placeholder for frame pointers
+        offset += frame_pointer_bytes * num_directions * frames_per_direction
 
         # Encode frames
-        for direction in self.Directions:
-            for frame in direction.Frames:
-                output.extend(struct.pack('<I', frame.Flipped))
-                output.extend(struct.pack('<I', frame.Width))
-                output.extend(struct.pack('<I', frame.Height))
-                output.extend(struct.pack('<i', frame.OffsetX))
-                output.extend(struct.pack('<i', frame.OffsetY))
-                output.extend(struct.pack('<I', frame.Unknown))
-                output.extend(struct.pack('<I', frame.NextBlock))
-                output.extend(struct.pack('<I', frame.Length))
-                output.extend(frame.FrameData)
-                output.extend(frame.Terminator)
+        for frame in frames:
+            _FRAME_HDR.pack_into(
+                output,
+                offset,
+                frame.Flipped,
+                frame.Width,
+                frame.Height,
+                frame.OffsetX,
+                frame.OffsetY,
+                frame.Unknown,
+                frame.NextBlock,
+                frame.Length,
+            )
+            offset += _FRAME_HDR.size
+            output[offset:offset + len(frame.FrameData)] = frame.FrameData
+            offset += len(frame.FrameData)
+            output[offset:offset + len(frame.Terminator)] = frame.Terminator
+            offset += len(frame.Terminator)
 
         return bytes(output)
 
@@ -759,9 +1068,9 @@ def read_dc6_file(file_path: str) -> DC6:
 
     1. Opening the file at the specified path in binary read mode ('rb') using a with statement. This ensures that the file is properly closed after it is read.
 
-    2. Reading the contents of the file into a byte string using the read() method.
+    2. Memory-mapping the contents of the file with mmap, so the file is parsed in place instead of being read into a byte string first.
 
-    3. Creating a new DC6 instance from the byte string using the from_bytes() class method.
+    3. Creating a new DC6 instance from the mapped file using the from_bytes() class method.
 
     4. Returning the new DC6 instance.
 
@@ -770,12 +1079,8 @@ def read_dc6_file(file_path: str) -> DC6:
     :return: An instance of the DC6 class
     :rtype: DC6
     """
-    with open(file_path, 'rb') as file:
-        # Read the contents of the file into a byte string
-        data = file.read()
-
-    # Create a new DC6 instance from the byte string
-    dc6 = DC6.from_bytes(data)
+    # Create a new DC6 instance from the memory-mapped file
+    dc6 = _read_mapped_file(file_path)
 
     # Return the new DC6 instance
     return dc6
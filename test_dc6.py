@@ -0,0 +1,176 @@
+import os
+import struct
+import tempfile
+import unittest
+from typing import List, Tuple
+
+import numpy as np
+from PIL import Image
+
+import dc6
+
+
+def build_dc6_directions(directions: List[List[Tuple[int, int, int, int, bytes]]]) -> bytes:
+    """
+    Builds a DC6 file holding the given frames in each direction.
+
+    :param directions: For each direction, a list of (width, height, offset_x, offset_y,
+        frame_data) tuples, one per frame
+    :return: The DC6 file as bytes
+    """
+    output = struct.pack('<iIII', 6, 1, 0, 0)
+    output += struct.pack('<II', len(directions), len(directions[0]))
+    output += bytes(4 * sum(len(frames) for frames in directions))  # Frame pointers
+    for frames in directions:
+        for width, height, offset_x, offset_y, frame_data in frames:
+            output += struct.pack('<IIIiiIII', 0, width, height, offset_x, offset_y, 0, 0, len(frame_data))
+            output += frame_data
+            output += bytes(dc6.TERMINATOR_SIZE)
+    return output
+
+
+def build_dc6(width: int, height: int, frame_data: bytes) -> bytes:
+    """
+    Builds a DC6 file with a single direction holding a single frame.
+
+    :param width: The width written to the frame header
+    :param height: The height written to the frame header
+    :param frame_data: The encoded frame data
+    :return: The DC6 file as bytes
+    """
+    return build_dc6_directions([[(width, height, 0, 0, frame_data)]])
+
+
+def read_dc6_bytes(data: bytes) -> dc6.DC6File:
+    """
+    Writes a DC6 file to a temporary directory and reads it back as a DC6File.
+
+    :param data: The DC6 file as bytes
+    :return: The parsed DC6File
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'test.dc6')
+        with open(path, 'wb') as file:
+            file.write(data)
+        return dc6.DC6File(path)
+
+
+class DecodeScanlinesTest(unittest.TestCase):
+    def test_decodes_rows_bottom_up(self):
+        # Bottom row: 1 transparent pixel then 1 opaque; top row: 2 opaque pixels
+        data = build_dc6(3, 2, bytes([0x81, 1, 9, 0x80, 2, 7, 8, 0x80]))
+        frame = dc6.DC6.from_bytes(data).Directions[0].Frames[0]
+        np.testing.assert_array_equal(frame.index_array, [[7, 8, 0], [0, 9, 0]])
+        self.assertEqual(frame.IndexData, bytes([7, 8, 0, 0, 9, 0]))
+
+    def test_zero_height_frame_writes_nothing(self):
+        data = build_dc6(1 << 30, 0, bytes([5]) + b'abcde' + bytes([0x80]))
+        frame = dc6.DC6.from_bytes(data).Directions[0].Frames[0]
+        self.assertEqual(frame.index_array.shape, (0, 1 << 30))
+
+    def test_zero_height_frame_leaves_scratch_untouched(self):
+        scratch = np.full(16, 0xAA, dtype=np.uint8)
+        framedata = np.frombuffer(bytes([5]) + b'abcde', dtype=np.uint8)
+        dc6._decode_scanlines(framedata, 4, 0, scratch[8:])
+        np.testing.assert_array_equal(scratch, np.full(16, 0xAA, dtype=np.uint8))
+
+    def test_runs_outside_the_frame_are_dropped(self):
+        # A run wider than the frame, then a run after the top row has ended
+        data = build_dc6(2, 1, bytes([4]) + b'abcd' + bytes([0x80, 0x80, 2]) + b'xy')
+        frame = dc6.DC6.from_bytes(data).Directions[0].Frames[0]
+        self.assertEqual(frame.IndexData, b'ab')
+
+
+class SerializeTest(unittest.TestCase):
+    def test_rectangular_directions_round_trip(self):
+        data = build_dc6_directions([
+            [(3, 2, -1, 4, bytes([0x81, 1, 9, 0x80, 2, 7, 8, 0x80])), (1, 1, 0, 0, bytes([1, 5, 0x80]))],
+            [(2, 1, 5, -6, bytes([2, 3, 4, 0x80])), (0, 0, 0, 0, b'')],
+        ])
+        parsed = read_dc6_bytes(data)
+        self.assertEqual(parsed.get_frames_per_direction(), 2)
+        self.assertEqual(parsed.dump(), data)
+        self.assertEqual(parsed.to_bytes(), data)
+
+    def test_ragged_directions_raise_value_error(self):
+        parsed = read_dc6_bytes(build_dc6(1, 1, bytes([1, 5, 0x80])))
+        parsed.Directions.append(dc6.Direction())  # Frame counts [1, 0]
+        for serialize in (parsed.dump, parsed.to_bytes):
+            with self.subTest(serialize.__name__), self.assertRaises(ValueError):
+                serialize()
+
+
+class DC6FileTest(unittest.TestCase):
+    def setUp(self):
+        # Two directions of two frames each
+        self.dc6_file = read_dc6_bytes(build_dc6_directions([
+            [(3, 2, 0, 0, bytes([0x81, 1, 9, 0x80, 2, 7, 8, 0x80])), (1, 1, 0, 0, bytes([1, 5, 0x80]))],
+            [(2, 1, 0, 0, bytes([2, 3, 4, 0x80])), (1, 1, 0, 0, bytes([0x81, 0x80]))],
+        ]))
+
+    def test_takes_over_the_parsed_state(self):
+        self.assertEqual((self.dc6_file.Version, self.dc6_file.Flags), (6, 1))
+        self.assertEqual([len(direction.Frames) for direction in self.dc6_file.Directions], [2, 2])
+        self.assertEqual(self.dc6_file.Directions[1].Frames[0].IndexData, bytes([3, 4]))
+
+    def test_as_dict_lists_the_frames_of_each_direction(self):
+        directions = self.dc6_file.as_dict()['Directions']
+        self.assertEqual(directions, [
+            {"Frames": [frame.as_dict() for frame in direction.Frames]}
+            for direction in self.dc6_file.Directions
+        ])
+        self.assertEqual([[frame['Width'] for frame in direction['Frames']] for direction in directions],
+                         [[3, 1], [2, 1]])
+
+
+class ReadFileTest(unittest.TestCase):
+    def write_file(self, directory: str, data: bytes) -> str:
+        path = os.path.join(directory, 'test.dc6')
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def test_reads_mapped_file(self):
+        data = build_dc6(3, 2, bytes([0x81, 1, 9, 0x80, 2, 7, 8, 0x80]))
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_file(directory, data)
+            self.assertEqual(dc6.DC6File(path).to_bytes(), data)
+            self.assertEqual(dc6.read_dc6_file(path).dump(), data)
+
+    def test_truncated_and_empty_files_raise_parse_errors(self):
+        data = build_dc6(3, 2, bytes([0x81, 1, 9, 0x80, 2, 7, 8, 0x80]))
+        with tempfile.TemporaryDirectory() as directory:
+            for contents in (data[:30], b''):
+                path = self.write_file(directory, contents)
+                with self.assertRaises(struct.error):
+                    dc6.DC6File(path)
+                with self.assertRaises(struct.error):
+                    dc6.read_dc6_file(path)
+
+
+class SaveFramesTest(unittest.TestCase):
+    def test_threaded_save_matches_serial_save(self):
+        # The same frame twice; row 0 is [7, 8, 0] and row 1 is [0, 9, 0]
+        data = build_dc6(3, 2, bytes([0x81, 1, 9, 0x80, 2, 7, 8, 0x80]))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'test.dc6')
+            with open(path, 'wb') as file:
+                file.write(data)
+            dc6_file = dc6.DC6File(path)
+            dc6_file.Directions[0].Frames.append(dc6_file.Directions[0].Frames[0])
+
+            serial_dir = os.path.join(directory, 'serial')
+            threaded_dir = os.path.join(directory, 'threaded')
+            dc6_file.save_frames(serial_dir)
+            dc6_file.save_frames(threaded_dir, max_workers=2)
+
+            for name in ('frame_dir0_frame0.png', 'frame_dir0_frame1.png'):
+                with Image.open(os.path.join(serial_dir, name)) as serial, \
+                        Image.open(os.path.join(threaded_dir, name)) as threaded:
+                    serial_pixels = np.asarray(serial)
+                    np.testing.assert_array_equal(serial_pixels, np.asarray(threaded))
+            np.testing.assert_array_equal(serial_pixels[:, :, 0], [[7, 8, 0], [0, 9, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()